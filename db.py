@@ -0,0 +1,15 @@
+import os
+
+def get_connection_string():
+    """
+    Build the data warehouse connection string from environment variables.
+    Shared by the dashboard and refresh_sales_cube.py.
+    """
+    # Get database credentials from environment variables
+    db_user = os.getenv('DB_USER', 'postgres')
+    db_password = os.getenv('DB_PASSWORD', '531')
+    db_host = os.getenv('DB_HOST', 'localhost')
+    db_name = os.getenv('DB_NAME', 'dwh_cw_001443')
+    db_port = os.getenv('DB_PORT', '5432')
+
+    return f'postgresql://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}'
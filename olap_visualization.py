@@ -2,10 +2,13 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+from plotly.subplots import make_subplots
 from sqlalchemy import create_engine, text
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import numpy as np
-import os
+from db import get_connection_string
 
 # Hide the menu button
 st.set_page_config(
@@ -25,70 +28,370 @@ footer {visibility: hidden;}
 """
 st.markdown(hide_st_style, unsafe_allow_html=True)
 
+@st.cache_resource
 def create_db_connection():
     """
-    Create database connection using environment variables
+    Create database connection using environment variables.
+    The engine is cached across reruns so its connection pool is reused.
     """
-    try:
-        # Get database credentials from environment variables
-        db_user = os.getenv('DB_USER', 'postgres')
-        db_password = os.getenv('DB_PASSWORD', '531')
-        db_host = os.getenv('DB_HOST', 'localhost')
-        db_name = os.getenv('DB_NAME', 'dwh_cw_001443')
-        db_port = os.getenv('DB_PORT', '5432')
+    # Create engine with a LIFO pool so a small set of warm connections is reused;
+    # stale connections are detected before use and recycled periodically
+    return create_engine(
+        get_connection_string(),
+        pool_size=5,
+        max_overflow=10,
+        pool_pre_ping=True,
+        pool_use_lifo=True,
+        pool_recycle=1800,
+        connect_args={"options": "-c statement_timeout=30000"}
+    )
 
-        # Create connection string
-        connection_string = f'postgresql://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}'
-        
-        # Create engine
-        engine = create_engine(connection_string)
-        return engine
-    except Exception as e:
-        st.error(f"Error connecting to database: {str(e)}")
-        return None
+# Pre-aggregated sales cube read by every operation; the fact table itself is never
+# scanned by the dashboard. Created and refreshed by refresh_sales_cube.py
+SALES_CUBE = "dm.mv_sales_cube"
 
-def load_data_from_dwh():
-    """Load data from data warehouse tables"""
-    try:
-        engine = create_db_connection()
-        if engine is None:
-            return None, None, None, None
+def query_dwh(sql, params=None):
+    """Run a query against the data warehouse and return the result as a DataFrame"""
+    engine = create_db_connection()
+    return pd.read_sql(text(sql), engine, params=params)
 
-        # Load dimension tables
-        dim_cars = pd.read_sql("SELECT * FROM dm.dim_cars", engine)
-        dim_customers = pd.read_sql("SELECT * FROM dm.dim_customers", engine)
-        dim_employees = pd.read_sql("SELECT * FROM dm.dim_employees", engine)
-        
-        # Load fact table with correct column aliases
-        fact_sales = pd.read_sql("""
-            SELECT 
-                f.ORDER_NUMBER,
-                f.ORDER_DATE,
-                f.QUANTITY,
-                f.TOTAL_SUM_USD,
-                f.TOTAL_SUM_EUR,
-                c.MODEL_NAME,
-                c.CATEGORY_NAME,
-                c.STATUS as CAR_STATUS,
-                c.CAR_PRICE,
-                cu.CUS_BUS_NAME,
-                cu.CITY_NAME,
-                cu.COUNTRY_NAME,
-                e.FIRST_NAME as EMPLOYEE_FIRST_NAME,
-                e.LAST_NAME as EMPLOYEE_LAST_NAME
-            FROM dm.fct_sales_dd f
-            JOIN dm.dim_cars c ON f.CAR_SURR_ID = c.CAR_SURR_ID
-            JOIN dm.dim_customers cu ON f.CUSTOMER_SURR_ID = cu.CUSTOMER_SURR_ID
-            JOIN dm.dim_employees e ON f.EMPLOYEE_SURR_ID = e.EMPLOYEE_SURR_ID
-        """, engine)
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_country_category_sales():
+    """Total sales and quantity by customers' country and car category"""
+    return query_dwh(f"""
+        SELECT 
+            COUNTRY_NAME,
+            CATEGORY_NAME,
+            SUM(TOTAL_SUM_USD) AS TOTAL_SUM_USD,
+            SUM(QUANTITY)::bigint AS QUANTITY
+        FROM {SALES_CUBE}
+        GROUP BY 1, 2
+        ORDER BY 1, 2
+    """)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_city_sales():
+    """Total sales by customers' country and city"""
+    return query_dwh(f"""
+        SELECT 
+            COUNTRY_NAME,
+            CITY_NAME,
+            SUM(TOTAL_SUM_USD) AS TOTAL_SUM_USD
+        FROM {SALES_CUBE}
+        GROUP BY 1, 2
+        ORDER BY 1, 2
+    """)
+
+# Roll-Up time periods mapped to their DATE_TRUNC grain and TO_CHAR label format
+TIME_PERIODS = {
+    "Monthly": ('month', 'YYYY-MM'),
+    "Quarterly": ('quarter', 'YYYY "Q"Q'),
+    "Yearly": ('year', 'YYYY'),
+}
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_period_sales(grain, label_format):
+    """
+    Total sales and quantity per period.
+    The period and its display label are derived in the same pass as the aggregation.
+    """
+    return query_dwh(f"""
+        SELECT 
+            DATE_TRUNC(:grain, ORDER_MONTH) AS PERIOD,
+            TO_CHAR(DATE_TRUNC(:grain, ORDER_MONTH), :label_format) AS PERIOD_LABEL,
+            SUM(TOTAL_SUM_USD) AS TOTAL_SUM_USD,
+            SUM(QUANTITY)::bigint AS QUANTITY
+        FROM {SALES_CUBE}
+        GROUP BY 1, 2
+        ORDER BY 1
+    """, {'grain': grain, 'label_format': label_format})
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_employee_sales():
+    """Total sales, quantity and order count per employee with their full name, best sellers first"""
+    return query_dwh(f"""
+        SELECT 
+            EMPLOYEE_FIRST_NAME,
+            EMPLOYEE_LAST_NAME,
+            SUM(TOTAL_SUM_USD) AS TOTAL_SUM_USD,
+            SUM(QUANTITY)::bigint AS QUANTITY,
+            SUM(ORDER_COUNT)::bigint AS ORDER_NUMBER,
+            EMPLOYEE_FIRST_NAME || ' ' || EMPLOYEE_LAST_NAME AS EMPLOYEE_NAME
+        FROM {SALES_CUBE}
+        GROUP BY 1, 2
+        ORDER BY 3 DESC NULLS LAST
+    """)
 
-        # Print column names for debugging
-        print("Available columns in fact_sales:", fact_sales.columns.tolist())
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_employee_category_sales():
+    """Total sales and quantity by employee and car category"""
+    return query_dwh(f"""
+        SELECT 
+            EMPLOYEE_FIRST_NAME,
+            EMPLOYEE_LAST_NAME,
+            CATEGORY_NAME,
+            SUM(TOTAL_SUM_USD) AS TOTAL_SUM_USD,
+            SUM(QUANTITY)::bigint AS QUANTITY
+        FROM {SALES_CUBE}
+        GROUP BY 1, 2, 3
+        ORDER BY 1, 2, 3
+    """)
 
-        return dim_cars, dim_customers, dim_employees, fact_sales
-    except Exception as e:
+def report_load_error(e):
+    """Show a data loading error to the user and stop the script"""
+    # PostgreSQL's undefined_table: the sales cube has not been created yet
+    if getattr(getattr(e, 'orig', None), 'pgcode', None) == '42P01':
+        st.error(f"The sales cube view {SALES_CUBE} does not exist in the data warehouse.")
+        st.error("Create it by running `python refresh_sales_cube.py` (see sql/mv_sales_cube.sql).")
+    else:
         st.error(f"Error loading data: {str(e)}")
-        return None, None, None, None
+        st.error("Failed to load data. Please check your database connection and try again.")
+    st.stop()
+
+def load_data(loader, *args):
+    """
+    Run a cached loader under a spinner.
+    Errors are reported to the user and stop the script; they are never cached.
+    """
+    with st.spinner('Loading data from database...'):
+        try:
+            return loader(*args)
+        except Exception as e:
+            report_load_error(e)
+
+def load_data_concurrently(*loaders):
+    """
+    Run independent cached loaders at once, each on its own pooled connection,
+    so the wait is the slowest query rather than the sum of all of them.
+    Errors are handled as in load_data.
+    """
+    ctx = get_script_run_ctx()
+    with st.spinner('Loading data from database...'):
+        try:
+            with ThreadPoolExecutor(max_workers=len(loaders),
+                                    initializer=lambda: add_script_run_ctx(ctx=ctx)) as executor:
+                futures = [executor.submit(loader) for loader in loaders]
+                return [future.result() for future in futures]
+        except Exception as e:
+            report_load_error(e)
+
+def sum_by_key(keys, values):
+    """
+    Sum values per key without pandas' groupby machinery.
+    Like groupby, keys come back sorted and NULL keys are dropped.
+    """
+    codes, uniques = pd.factorize(keys, sort=True)
+    values = np.asarray(values)
+    
+    # NULL keys get code -1 and have no entry in uniques
+    has_key = codes >= 0
+    codes, values = codes[has_key], values[has_key]
+    
+    # Sort by code so equal keys form contiguous runs, then sum each run
+    order = np.argsort(codes, kind='stable')
+    codes, values = codes[order], values[order]
+    run_starts = np.flatnonzero(np.diff(codes, prepend=-1))
+    return uniques, np.add.reduceat(values, run_starts)
+
+def top_n(df, column, n):
+    """
+    Return the rows with the n largest values of column, largest first.
+    As with DataFrame.nlargest(n, column), ties keep row order; NULL values are skipped.
+    Uses np.partition (O(N)) and only sorts the n selected rows.
+    """
+    values = df[column].to_numpy()
+    positions = np.flatnonzero(pd.notna(values))
+    if len(positions) > n:
+        valid = values[positions]
+        # n-th largest value; rows tied at this cutoff are taken in row order
+        cutoff = np.partition(valid, len(valid) - n)[len(valid) - n]
+        above = positions[valid > cutoff]
+        at_cutoff = positions[valid == cutoff][:n - len(above)]
+        positions = np.concatenate((above, at_cutoff))
+    # Largest first, ties broken on original row position
+    return df.iloc[positions[np.lexsort((positions, -values[positions]))]]
+
+# Figure builders are cached on their input data and return plain dicts, so
+# reruns skip plotly's figure construction and layout work
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def build_treemap(country_category_sales):
+    """Treemap of total sales by country and car category"""
+    fig = px.treemap(country_category_sales,
+                    path=['country_name', 'category_name'],
+                    values='total_sum_usd',
+                    color='total_sum_usd',
+                    color_continuous_scale='Viridis',
+                    title='Total Sales by Country and Car Category',
+                    custom_data=['quantity', 'total_sum_usd'])
+    
+    # Update hover template and add text inside boxes
+    fig.update_traces(
+        hovertemplate="<br>".join([
+            "Country: %{label}",
+            "Category: %{customdata[0]}",
+            "Total Sales: $%{customdata[1]:,.2f}",
+            "Quantity Sold: %{customdata[2]:,}"
+        ]),
+        texttemplate="%{label}<br>$%{value:,.0f}<br>(%{percentParent:.1%})",
+        textposition="middle center",
+        textfont=dict(size=14)
+    )
+    
+    # Update layout for better readability
+    fig.update_layout(
+        margin=dict(t=50, l=25, r=25, b=25),
+        uniformtext=dict(minsize=12, mode='hide'),
+        font=dict(size=14)
+    )
+    
+    return fig.to_dict()
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def build_sunburst(city_sales):
+    """Sunburst drilling down from country to city sales"""
+    fig = px.sunburst(city_sales, 
+                     path=['country_name', 'city_name'], 
+                     values='total_sum_usd',
+                     title='Sales Drill-Down: Country to City')
+    return fig.to_dict()
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def build_trend_chart(period_data, time_period):
+    """Dual-axis line chart of sales and quantity per period"""
+    title = f'{time_period} Sales Trend'
+    
+    # Create line chart
+    fig = go.Figure()
+    
+    # Add sales line
+    fig.add_trace(go.Scatter(
+        x=period_data['period_label'],
+        y=period_data['total_sum_usd'],
+        mode='lines+markers',
+        name='Total Sales (USD)',
+        line=dict(color='#1f77b4', width=2),
+        marker=dict(size=8),
+        hovertemplate="<br>".join([
+            f"{time_period}: %{{x}}",
+            "Sales: $%{y:,.2f}",
+            "<extra></extra>"
+        ])
+    ))
+    
+    # Add quantity line
+    fig.add_trace(go.Scatter(
+        x=period_data['period_label'],
+        y=period_data['quantity'],
+        mode='lines+markers',
+        name='Quantity Sold',
+        line=dict(color='#ff7f0e', width=2),
+        marker=dict(size=8),
+        yaxis='y2',
+        hovertemplate="<br>".join([
+            f"{time_period}: %{{x}}",
+            "Quantity: %{y:,}",
+            "<extra></extra>"
+        ])
+    ))
+    
+    # Update layout
+    fig.update_layout(
+        title=title,
+        xaxis_title=time_period,
+        yaxis_title='Total Sales (USD)',
+        yaxis2=dict(
+            title='Quantity Sold',
+            overlaying='y',
+            side='right'
+        ),
+        hovermode='x unified',
+        showlegend=True,
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1
+        )
+    )
+    
+    return fig.to_dict()
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def build_employee_bar(top_employees):
+    """Bar chart of the top employees by total sales"""
+    fig = px.bar(
+        top_employees,
+        x='employee_name',
+        y='total_sum_usd',
+        color='total_sum_usd',
+        color_continuous_scale='Viridis',
+        title='Top 3 Employees by Total Sales',
+        text='total_sum_usd',
+        labels={'employee_name': 'Employee', 'total_sum_usd': 'Total Sales (USD)'}
+    )
+    
+    # Update bar chart layout
+    fig.update_traces(
+        texttemplate='$%{text:,.0f}',
+        textposition='outside',
+        hovertemplate="<br>".join([
+            "Employee: %{x}",
+            "Total Sales: $%{y:,.2f}",
+            "Orders: %{customdata[0]:,}",
+            "Units Sold: %{customdata[1]:,}"
+        ]),
+        customdata=top_employees[['order_number', 'quantity']].values
+    )
+    
+    # Update layout
+    fig.update_layout(
+        yaxis_title='Total Sales (USD)',
+        showlegend=False,
+        uniformtext_minsize=12,
+        uniformtext_mode='hide'
+    )
+    
+    return fig.to_dict()
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def build_category_pies(employee_category_sales, top_employees):
+    """
+    Donut charts of each top employee's sales by car category, side by side
+    in a single figure so the browser lays them out in one render pass.
+    employee_category_sales must be indexed by employee first and last name.
+    """
+    fig = make_subplots(
+        rows=1,
+        cols=len(top_employees),
+        specs=[[{'type': 'domain'}] * len(top_employees)],
+        subplot_titles=top_employees['employee_name'].tolist()
+    )
+    
+    employees = top_employees[['employee_first_name', 'employee_last_name', 'employee_name']]
+    for col, (first_name, last_name, employee_name) in enumerate(
+        employees.itertuples(index=False, name=None), start=1
+    ):
+        employee_categories = employee_category_sales.loc[[(first_name, last_name)]]
+        fig.add_trace(go.Pie(
+            labels=employee_categories['category_name'],
+            values=employee_categories['total_sum_usd'],
+            name=employee_name,
+            hole=0.4,
+            textposition='inside',
+            textinfo='percent+label',
+            hovertemplate="<br>".join([
+                "Category: %{label}",
+                "Sales: $%{value:,.2f}",
+                "Quantity: %{customdata[0]:,}"
+            ]),
+            customdata=employee_categories[['quantity']].values
+        ), row=1, col=col)
+    
+    fig.update_layout(title='Sales Distribution by Category')
+    
+    return fig.to_dict()
 
 def olap_visualization():
     """
@@ -109,13 +412,6 @@ def olap_visualization():
 
     st.title("📊 OLAP Operations Dashboard")
 
-    # Load data
-    with st.spinner('Loading data from database...'):
-        dim_cars, dim_customers, dim_employees, fact_sales = load_data_from_dwh()
-        if any(x is None for x in [dim_cars, dim_customers, dim_employees, fact_sales]):
-            st.error("Failed to load data. Please check your database connection and try again.")
-            return
-
     # Sidebar for OLAP operation selection
     st.sidebar.title("OLAP Operations")
     operation = st.sidebar.selectbox(
@@ -130,45 +426,11 @@ def olap_visualization():
         Here we'll analyze total sales by customers' country and car category.
         """)
         
-        # Group by country and category, calculate total sales and quantity
-        country_category_sales = fact_sales.groupby(['country_name', 'category_name']).agg({
-            'total_sum_usd': 'sum',
-            'quantity': 'sum'
-        }).reset_index()
+        # Load total sales and quantity by country and category
+        country_category_sales = load_data(load_country_category_sales)
         
         # Create treemap visualization
-        fig = px.treemap(country_category_sales,
-                        path=['country_name', 'category_name'],
-                        values='total_sum_usd',
-                        color='total_sum_usd',
-                        color_continuous_scale='Viridis',
-                        title='Total Sales by Country and Car Category',
-                        custom_data=['quantity', 'total_sum_usd'])
-        
-        # Calculate total sales by country for percentage calculation
-        country_totals = country_category_sales.groupby('country_name')['total_sum_usd'].sum()
-        
-        # Update hover template and add text inside boxes
-        fig.update_traces(
-            hovertemplate="<br>".join([
-                "Country: %{label}",
-                "Category: %{customdata[0]}",
-                "Total Sales: $%{customdata[1]:,.2f}",
-                "Quantity Sold: %{customdata[2]:,}"
-            ]),
-            texttemplate="%{label}<br>$%{value:,.0f}<br>(%{percentParent:.1%})",
-            textposition="middle center",
-            textfont=dict(size=14)
-        )
-        
-        # Update layout for better readability
-        fig.update_layout(
-            margin=dict(t=50, l=25, r=25, b=25),
-            uniformtext=dict(minsize=12, mode='hide'),
-            font=dict(size=14)
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(go.Figure(build_treemap(country_category_sales)), use_container_width=True)
         
         # Add detailed table
         st.subheader("Detailed Sales by Country and Category")
@@ -178,17 +440,17 @@ def olap_visualization():
         st.subheader("Summary Statistics")
         
         # Calculate top performing combinations
-        top_combinations = country_category_sales.nlargest(5, 'total_sum_usd')
+        top_combinations = top_n(country_category_sales, 'total_sum_usd', 5)
         
-        # Display top combinations
+        # Display top combinations as a single table
         st.write("Top 5 Country-Category Combinations by Sales:")
-        for idx, row in top_combinations.iterrows():
-            st.write(f"📍 {row['country_name']} - {row['category_name']}:")
-            col1, col2 = st.columns(2)
-            with col1:
-                st.metric("Total Sales", f"${row['total_sum_usd']:,.2f}")
-            with col2:
-                st.metric("Units Sold", f"{row['quantity']:,}")
+        st.dataframe(
+            top_combinations.style.format({
+                'total_sum_usd': '${:,.2f}',
+                'quantity': '{:,.0f}'
+            }),
+            hide_index=True
+        )
 
     elif operation == "Drill-Down":
         st.header("🔍 Drill-Down Operation")
@@ -198,15 +460,14 @@ def olap_visualization():
         """)
         
         # Create drill-down visualization
-        country_sales = fact_sales.groupby('country_name')['total_sum_usd'].sum().reset_index()
-        city_sales = fact_sales.groupby(['country_name', 'city_name'])['total_sum_usd'].sum().reset_index()
+        city_sales = load_data(load_city_sales)
+        
+        # Roll city rows up to country totals
+        countries, country_totals = sum_by_key(city_sales['country_name'], city_sales['total_sum_usd'])
+        country_sales = pd.DataFrame({'country_name': countries, 'total_sum_usd': country_totals})
         
         # Create sunburst chart for drill-down
-        fig = px.sunburst(city_sales, 
-                         path=['country_name', 'city_name'], 
-                         values='total_sum_usd',
-                         title='Sales Drill-Down: Country to City')
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(go.Figure(build_sunburst(city_sales)), use_container_width=True)
 
         # Add detailed tables
         st.subheader("Country Level Sales")
@@ -223,110 +484,19 @@ def olap_visualization():
         
         # Create roll-up visualization
         try:
-            # Convert order_date to datetime
-            fact_sales['order_date'] = pd.to_datetime(fact_sales['order_date'])
-            
-            # Extract different time periods
-            fact_sales['year'] = fact_sales['order_date'].dt.year
-            fact_sales['quarter'] = fact_sales['order_date'].dt.quarter
-            fact_sales['month'] = fact_sales['order_date'].dt.month
-            fact_sales['day'] = fact_sales['order_date'].dt.day
-            fact_sales['year_quarter'] = fact_sales['year'].astype(str) + ' Q' + fact_sales['quarter'].astype(str)
-            fact_sales['year_month'] = fact_sales['order_date'].dt.strftime('%Y-%m')
-            fact_sales['date'] = fact_sales['order_date'].dt.strftime('%Y-%m-%d')
-            
             # Create time period selector
             time_period = st.radio(
                 "Select Time Period:",
-                ["Monthly", "Quarterly", "Yearly"],
+                list(TIME_PERIODS),
                 horizontal=True
             )
             
             # Aggregate data based on selected time period
-            if time_period == "Monthly":
-                period_data = fact_sales.groupby('year_month').agg({
-                    'total_sum_usd': 'sum',
-                    'quantity': 'sum'
-                }).reset_index()
-                period_data['period'] = pd.to_datetime(period_data['year_month'] + '-01')
-                x_axis = 'year_month'
-                title = 'Monthly Sales Trend'
-            elif time_period == "Quarterly":
-                period_data = fact_sales.groupby('year_quarter').agg({
-                    'total_sum_usd': 'sum',
-                    'quantity': 'sum'
-                }).reset_index()
-                period_data['period'] = pd.to_datetime(period_data['year_quarter'].str.replace(' Q', '-Q'))
-                x_axis = 'year_quarter'
-                title = 'Quarterly Sales Trend'
-            else:  # Yearly
-                period_data = fact_sales.groupby('year').agg({
-                    'total_sum_usd': 'sum',
-                    'quantity': 'sum'
-                }).reset_index()
-                period_data['period'] = pd.to_datetime(period_data['year'].astype(str) + '-01-01')
-                x_axis = 'year'
-                title = 'Yearly Sales Trend'
-            
-            # Sort data by period
-            period_data = period_data.sort_values('period')
+            grain, label_format = TIME_PERIODS[time_period]
+            period_data = load_data(load_period_sales, grain, label_format)
             
             # Create line chart
-            fig = go.Figure()
-            
-            # Add sales line
-            fig.add_trace(go.Scatter(
-                x=period_data[x_axis],
-                y=period_data['total_sum_usd'],
-                mode='lines+markers',
-                name='Total Sales (USD)',
-                line=dict(color='#1f77b4', width=2),
-                marker=dict(size=8),
-                hovertemplate="<br>".join([
-                    f"{time_period}: %{{x}}",
-                    "Sales: $%{y:,.2f}",
-                    "<extra></extra>"
-                ])
-            ))
-            
-            # Add quantity line
-            fig.add_trace(go.Scatter(
-                x=period_data[x_axis],
-                y=period_data['quantity'],
-                mode='lines+markers',
-                name='Quantity Sold',
-                line=dict(color='#ff7f0e', width=2),
-                marker=dict(size=8),
-                yaxis='y2',
-                hovertemplate="<br>".join([
-                    f"{time_period}: %{{x}}",
-                    "Quantity: %{y:,}",
-                    "<extra></extra>"
-                ])
-            ))
-            
-            # Update layout
-            fig.update_layout(
-                title=title,
-                xaxis_title=time_period,
-                yaxis_title='Total Sales (USD)',
-                yaxis2=dict(
-                    title='Quantity Sold',
-                    overlaying='y',
-                    side='right'
-                ),
-                hovermode='x unified',
-                showlegend=True,
-                legend=dict(
-                    orientation="h",
-                    yanchor="bottom",
-                    y=1.02,
-                    xanchor="right",
-                    x=1
-                )
-            )
-            
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(go.Figure(build_trend_chart(period_data, time_period)), use_container_width=True)
             
             # Display detailed information
             st.subheader("Detailed Sales Information")
@@ -364,104 +534,48 @@ def olap_visualization():
         Here we'll analyze the top-3 employees by total sales performance.
         """)
         
-        # Group by employee and calculate total sales and quantity
-        employee_sales = fact_sales.groupby(['employee_first_name', 'employee_last_name']).agg({
-            'total_sum_usd': 'sum',
-            'quantity': 'sum',
-            'order_number': 'count'
-        }).reset_index()
-        
-        # Create full name column
-        employee_sales['employee_name'] = employee_sales['employee_first_name'] + ' ' + employee_sales['employee_last_name']
+        # Load total sales, quantity and orders per employee (best sellers first)
+        # together with the category breakdown for every employee
+        employee_sales, employee_category_sales = load_data_concurrently(
+            load_employee_sales, load_employee_category_sales
+        )
         
         # Get top 3 employees
-        top_employees = employee_sales.nlargest(3, 'total_sum_usd')
+        top_employees = employee_sales.head(3)
         
         # Create bar chart for top 3 employees
-        fig = px.bar(
-            top_employees,
-            x='employee_name',
-            y='total_sum_usd',
-            color='total_sum_usd',
-            color_continuous_scale='Viridis',
-            title='Top 3 Employees by Total Sales',
-            text='total_sum_usd',
-            labels={'employee_name': 'Employee', 'total_sum_usd': 'Total Sales (USD)'}
-        )
-        
-        # Update bar chart layout
-        fig.update_traces(
-            texttemplate='$%{text:,.0f}',
-            textposition='outside',
-            hovertemplate="<br>".join([
-                "Employee: %{x}",
-                "Total Sales: $%{y:,.2f}",
-                "Orders: %{customdata[0]:,}",
-                "Units Sold: %{customdata[1]:,}"
-            ]),
-            customdata=top_employees[['order_number', 'quantity']].values
-        )
+        st.plotly_chart(go.Figure(build_employee_bar(top_employees)), use_container_width=True)
         
-        # Update layout
-        fig.update_layout(
-            yaxis_title='Total Sales (USD)',
-            showlegend=False,
-            uniformtext_minsize=12,
-            uniformtext_mode='hide'
+        # Index the category breakdown by employee name for per-employee lookups
+        employee_category_sales = employee_category_sales.set_index(
+            ['employee_first_name', 'employee_last_name']
         )
         
-        st.plotly_chart(fig, use_container_width=True)
-        
-        # Display detailed information
+        # Display detailed information as a single table
         st.subheader("Top 3 Employees Performance")
+        st.dataframe(
+            top_employees[['employee_name', 'total_sum_usd', 'order_number', 'quantity']]
+            .style.format({
+                'total_sum_usd': '${:,.2f}',
+                'quantity': '{:,.0f}',
+                'order_number': '{:,.0f}'
+            }),
+            hide_index=True
+        )
         
-        # Create columns for metrics
-        for idx, row in top_employees.iterrows():
-            st.write(f"### {row['employee_name']}")
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("Total Sales", f"${row['total_sum_usd']:,.2f}")
-            with col2:
-                st.metric("Total Orders", f"{row['order_number']:,}")
-            with col3:
-                st.metric("Units Sold", f"{row['quantity']:,}")
-            
-            # Show sales breakdown by category for each employee
-            employee_categories = fact_sales[
-                (fact_sales['employee_first_name'] == row['employee_first_name']) & 
-                (fact_sales['employee_last_name'] == row['employee_last_name'])
-            ].groupby('category_name').agg({
-                'total_sum_usd': 'sum',
-                'quantity': 'sum'
-            }).reset_index()
-            
-            # Create pie chart for category distribution
-            fig_category = px.pie(
-                employee_categories,
-                values='total_sum_usd',
-                names='category_name',
-                title=f'Sales Distribution by Category - {row["employee_name"]}',
-                hole=0.4
-            )
-            
-            fig_category.update_traces(
-                textposition='inside',
-                textinfo='percent+label',
-                hovertemplate="<br>".join([
-                    "Category: %{label}",
-                    "Sales: $%{value:,.2f}",
-                    "Quantity: %{customdata[0]:,}"
-                ]),
-                customdata=employee_categories['quantity'].values
+        # Show sales breakdown by category for each employee in one figure
+        if top_employees.empty:
+            st.info("No employee sales to break down by category.")
+        else:
+            st.plotly_chart(
+                go.Figure(build_category_pies(employee_category_sales, top_employees)),
+                use_container_width=True
             )
-            
-            st.plotly_chart(fig_category, use_container_width=True)
         
         # Show complete employee ranking
         st.subheader("Complete Employee Ranking")
         st.dataframe(
-            employee_sales.sort_values('total_sum_usd', ascending=False)
-            .style.format({
+            employee_sales.style.format({
                 'total_sum_usd': '${:,.2f}',
                 'quantity': '{:,.0f}',
                 'order_number': '{:,.0f}'
@@ -0,0 +1,54 @@
+"""
+Create and refresh the sales cube materialized view read by the OLAP dashboard.
+
+Run once on deploy to create dm.mv_sales_cube, then nightly after the DWH load,
+e.g. from cron:
+
+    0 3 * * * cd /path/to/olap_dashboard && python refresh_sales_cube.py
+
+The view is (re)built from sql/mv_sales_cube.sql whenever it is missing or the
+file has changed since it was built; otherwise it is refreshed concurrently.
+Uses the same DB_* environment variables as olap_visualization.py.
+"""
+from sqlalchemy import create_engine, text
+from db import get_connection_string
+import hashlib
+import os
+
+CUBE_VIEW = 'dm.mv_sales_cube'
+CUBE_SQL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sql', 'mv_sales_cube.sql')
+
+def refresh_sales_cube():
+    """
+    Rebuild the sales cube if it is missing or its definition changed, else refresh it.
+    The definition's hash is stored as the view's comment to detect changes.
+    Returns True if the view was (re)built.
+    """
+    with open(CUBE_SQL_PATH) as f:
+        cube_sql = f.read()
+    definition = f"Built from sql/mv_sales_cube.sql sha256:{hashlib.sha256(cube_sql.encode()).hexdigest()}"
+
+    engine = create_engine(get_connection_string())
+    with engine.begin() as conn:
+        built_from = conn.execute(
+            text("SELECT obj_description(to_regclass(:view), 'pg_class')"), {'view': CUBE_VIEW}
+        ).scalar()
+        exists = conn.execute(text("SELECT to_regclass(:view)"), {'view': CUBE_VIEW}).scalar() is not None
+
+        if exists and built_from == definition:
+            # Up to date: refresh without blocking dashboard reads
+            conn.exec_driver_sql(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {CUBE_VIEW}")
+            return False
+
+        # Missing or out of date: (re)create it; the view is populated on creation,
+        # so no refresh is needed afterwards
+        conn.exec_driver_sql(f"DROP MATERIALIZED VIEW IF EXISTS {CUBE_VIEW}")
+        conn.exec_driver_sql(cube_sql)
+        conn.exec_driver_sql(f"COMMENT ON MATERIALIZED VIEW {CUBE_VIEW} IS '{definition}'")
+        return True
+
+if __name__ == "__main__":
+    if refresh_sales_cube():
+        print(f"Built {CUBE_VIEW} from {CUBE_SQL_PATH}")
+    else:
+        print(f"Refreshed {CUBE_VIEW}")
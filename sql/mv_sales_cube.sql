@@ -0,0 +1,31 @@
+-- Sales cube read by the OLAP dashboard (olap_visualization.py).
+-- Pre-aggregates dm.fct_sales_dd at the finest grain any dashboard
+-- operation needs, so each operation only re-aggregates a few hundred
+-- rows instead of joining and scanning the full fact table.
+--
+-- Applied by refresh_sales_cube.py: run it once on deploy and schedule it
+-- nightly after the DWH load. It rebuilds the view from this file whenever
+-- the file changes, so edits here take effect on the next run.
+
+CREATE MATERIALIZED VIEW dm.mv_sales_cube AS
+SELECT 
+    cu.COUNTRY_NAME,
+    cu.CITY_NAME,
+    c.CATEGORY_NAME,
+    e.FIRST_NAME AS EMPLOYEE_FIRST_NAME,
+    e.LAST_NAME AS EMPLOYEE_LAST_NAME,
+    DATE_TRUNC('month', f.ORDER_DATE::timestamp) AS ORDER_MONTH,
+    SUM(f.TOTAL_SUM_USD) AS TOTAL_SUM_USD,
+    SUM(f.QUANTITY) AS QUANTITY,
+    COUNT(f.ORDER_NUMBER) AS ORDER_COUNT
+FROM dm.fct_sales_dd f
+JOIN dm.dim_cars c ON f.CAR_SURR_ID = c.CAR_SURR_ID
+JOIN dm.dim_customers cu ON f.CUSTOMER_SURR_ID = cu.CUSTOMER_SURR_ID
+JOIN dm.dim_employees e ON f.EMPLOYEE_SURR_ID = e.EMPLOYEE_SURR_ID
+GROUP BY 1, 2, 3, 4, 5, 6
+WITH DATA;
+
+-- Required by REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX mv_sales_cube_grain_idx
+    ON dm.mv_sales_cube (COUNTRY_NAME, CITY_NAME, CATEGORY_NAME,
+                         EMPLOYEE_FIRST_NAME, EMPLOYEE_LAST_NAME, ORDER_MONTH);